@@ -29,7 +29,8 @@ def merge(arr, left, mid, right):
     i, j, k = 0, 0, left
 
     while i < n1 and j < n2:
-        if L[i] < R[j]:
+        # <= takes from the left run on ties, which keeps the sort stable
+        if L[i] <= R[j]:
             arr[k] = L[i]
             i += 1
         else:
@@ -51,7 +52,9 @@ def merge(arr, left, mid, right):
         j += 1
     return comparisons
 
-def hybrid_sort(arr, left, right, S):
+def hybrid_sort(arr, left, right, S, key=None):
+    if key is not None:
+        return _sort_by_key(arr, left, right, S, key)
     if right - left + 1 <= S:
         return insertion_sort(arr, left, right)
     mid = (left + right) // 2
@@ -61,7 +64,9 @@ def hybrid_sort(arr, left, right, S):
     comparisons += merge(arr, left, mid, right)
     return comparisons
 
-def merge_sort(arr, left, right):
+def merge_sort(arr, left, right, key=None):
+    if key is not None:
+        return _sort_by_key(arr, left, right, 1, key)
     if left >= right:
         return 0
 
@@ -71,3 +76,174 @@ def merge_sort(arr, left, right):
     comparisons += merge_sort(arr, mid + 1, right)
     comparisons += merge(arr, left, mid, right)
     return comparisons
+
+
+
+# ── Key-function sorting ─────────────────────────────────────────────────────
+# keys[i] is evaluated once and moves together with vals[i]; only keys are compared
+
+def insertion_sort_keyed(keys, vals, left, right):
+    comparisons = 0
+    for i in range(left + 1, right + 1):
+        key, val = keys[i], vals[i]
+        j = i - 1
+        while j >= left and keys[j] > key:
+            keys[j + 1] = keys[j]
+            vals[j + 1] = vals[j]
+            j -= 1
+            comparisons += 1
+        if j >= left:
+            comparisons += 1
+        keys[j + 1] = key
+        vals[j + 1] = val
+    return comparisons
+
+def merge_keyed(keys, vals, left, mid, right):
+    comparisons = 0
+    n1 = mid - left + 1
+    n2 = right - mid
+
+    LK = keys[left:mid + 1]
+    RK = keys[mid + 1:right + 1]
+    LV = vals[left:mid + 1]
+    RV = vals[mid + 1:right + 1]
+
+    i, j, k = 0, 0, left
+
+    while i < n1 and j < n2:
+        if LK[i] <= RK[j]:
+            keys[k] = LK[i]
+            vals[k] = LV[i]
+            i += 1
+        else:
+            keys[k] = RK[j]
+            vals[k] = RV[j]
+            j += 1
+        comparisons += 1
+        k += 1
+
+    # only one side can have items left, and they are already sorted
+    if i < n1:
+        keys[k:right + 1] = LK[i:]
+        vals[k:right + 1] = LV[i:]
+    elif j < n2:
+        keys[k:right + 1] = RK[j:]
+        vals[k:right + 1] = RV[j:]
+    return comparisons
+
+def hybrid_sort_keyed(keys, vals, left, right, S):
+    if right - left + 1 <= S:
+        return insertion_sort_keyed(keys, vals, left, right)
+    mid = (left + right) // 2
+    comparisons = 0
+    comparisons += hybrid_sort_keyed(keys, vals, left, mid, S)
+    comparisons += hybrid_sort_keyed(keys, vals, mid + 1, right, S)
+    comparisons += merge_keyed(keys, vals, left, mid, right)
+    return comparisons
+
+def _sort_by_key(arr, left, right, S, key):
+    if left >= right:
+        return 0
+    vals = arr[left:right + 1]
+    keys = [key(v) for v in vals]
+    comparisons = hybrid_sort_keyed(keys, vals, 0, len(vals) - 1, S)
+    arr[left:right + 1] = vals
+    return comparisons
+
+# ── Partial sort / top-k ─────────────────────────────────────────────────────
+
+def merge_partial(arr, left, mid, right, k, k1, k2):
+    # arr[left:left+k1] and arr[mid+1:mid+1+k2] are the sorted prefixes of each half;
+    # only the first k outputs of the merge are produced
+    comparisons = 0
+    L = arr[left:left + k1]
+    R = arr[mid + 1:mid + 1 + k2]
+
+    i, j, k_out = 0, 0, left
+    stop = left + k
+
+    while i < k1 and j < k2 and k_out < stop:
+        if L[i] <= R[j]:
+            arr[k_out] = L[i]
+            i += 1
+        else:
+            arr[k_out] = R[j]
+            j += 1
+        comparisons += 1
+        k_out += 1
+
+    # one side ran out before k outputs: the other side's prefix is already in order
+    while i < k1 and k_out < stop:
+        arr[k_out] = L[i]
+        k_out += 1
+        i += 1
+
+    while j < k2 and k_out < stop:
+        arr[k_out] = R[j]
+        k_out += 1
+        j += 1
+
+    # k <= k1 + k2, so exactly k items were output into arr[left:left+k]. That overlaps
+    # only the two prefixes; the unconsumed prefix items go into the prefix slots past it.
+    # Everything beyond the prefixes is untouched, so each call moves O(k) items.
+    arr[max(mid + 1, stop):mid + 1 + k2] = L[i:] + R[j:]
+    return comparisons
+
+def hybrid_partial_sort(arr, left, right, S, k):
+    # after the call arr[left:left+k] holds the k smallest items in sorted order
+    n = right - left + 1
+    k = min(k, n)
+    if k <= 0:
+        return 0
+    if n <= S:
+        return insertion_sort(arr, left, right)
+    mid = (left + right) // 2
+    k1 = min(k, mid - left + 1)
+    k2 = min(k, right - mid)
+    comparisons = 0
+    comparisons += hybrid_partial_sort(arr, left, mid, S, k1)
+    comparisons += hybrid_partial_sort(arr, mid + 1, right, S, k2)
+    comparisons += merge_partial(arr, left, mid, right, k, k1, k2)
+    return comparisons
+
+def merge_sort_partial(arr, left, right, k):
+    return hybrid_partial_sort(arr, left, right, 1, k)
+
+_DONE = object()
+
+def _merge_lazy(left_gen, right_gen, counter):
+    a = next(left_gen, _DONE)
+    b = next(right_gen, _DONE)
+    while a is not _DONE and b is not _DONE:
+        counter[0] += 1
+        if a <= b:
+            yield a
+            a = next(left_gen, _DONE)
+        else:
+            yield b
+            b = next(right_gen, _DONE)
+    while a is not _DONE:
+        yield a
+        a = next(left_gen, _DONE)
+    while b is not _DONE:
+        yield b
+        b = next(right_gen, _DONE)
+
+def _hybrid_sort_lazy(arr, left, right, S, counter):
+    if right - left + 1 <= S:
+        counter[0] += insertion_sort(arr, left, right)
+        return iter(arr[left:right + 1])
+    mid = (left + right) // 2
+    return _merge_lazy(_hybrid_sort_lazy(arr, left, mid, S, counter),
+                       _hybrid_sort_lazy(arr, mid + 1, right, S, counter),
+                       counter)
+
+def hybrid_sort_lazy(arr, left, right, S, counter=None):
+    """Yield arr[left:right+1] in sorted order, merging only as far as it is consumed.
+    counter is an optional one-element list that accumulates key comparisons.
+    All leaves are insertion sorted in place on the first next(); arr is otherwise untouched."""
+    if counter is None:
+        counter = [0]
+    if left > right:
+        return
+    yield from _hybrid_sort_lazy(arr, left, right, S, counter)
@@ -1,7 +1,7 @@
 import random
 import time
-import matplotlib.pyplot as plt
-from algorithms import hybrid_sort, merge_sort
+from algorithms import hybrid_sort, merge_sort, hybrid_partial_sort
+from results import ResultsSink
 
 
 # ── Data generation ───────────────────────────────────────────────────────────
@@ -19,45 +19,57 @@ SIZES = [1_000, 2_000, 5_000, 10_000, 20_000, 50_000,
 
 # ── Experiment (c-i): fixed S, vary n ────────────────────────────────────────
 
-def experiment_vary_n(S, sizes=SIZES):
+def experiment_vary_n(S, sizes=SIZES, *, sink=None):
     """Run hybrid_sort with a fixed S over increasing array sizes.
-    Returns (sizes, comparisons_list)."""
+    Returns (sizes, comparisons_list); each cell is also streamed to sink."""
     results = []
     for n in sizes:
         arr = generate_array(n)
+        t0 = time.perf_counter()
         comps = hybrid_sort(arr, 0, n - 1, S)
+        t1 = time.perf_counter()
         results.append(comps)
+        if sink:
+            sink.write("vary_n", n=n, S=S, comparisons=comps, time_s=t1 - t0)
         print(f"  n={n:>10,}  comparisons={comps:,}")
     return sizes, results
 
 
 # ── Experiment (c-ii): fixed n, vary S ───────────────────────────────────────
 
-def experiment_vary_S(n, S_values):
+def experiment_vary_S(n, S_values, *, sink=None):
     """Run hybrid_sort with a fixed n over different S values.
-    Returns (S_values, comparisons_list)."""
+    Returns (S_values, comparisons_list); each cell is also streamed to sink."""
     arr_original = generate_array(n)
     results = []
     for S in S_values:
         arr = arr_original.copy()
+        t0 = time.perf_counter()
         comps = hybrid_sort(arr, 0, n - 1, S)
+        t1 = time.perf_counter()
         results.append(comps)
+        if sink:
+            sink.write("vary_S", n=n, S=S, comparisons=comps, time_s=t1 - t0)
         print(f"  S={S:>6}  comparisons={comps:,}")
     return S_values, results
 
 
 # ── Experiment (c-iii): find optimal S ───────────────────────────────────────
 
-def experiment_optimal_S(sizes, S_values):
+def experiment_optimal_S(sizes, S_values, *, sink=None):
     """For each array size, find the S that minimises comparisons.
-    Returns dict {n: optimal_S}."""
+    Returns dict {n: optimal_S}; every (n, S) cell is also streamed to sink."""
     optimal = {}
     for n in sizes:
         arr_original = generate_array(n)
         best_S, best_comps = None, float('inf')
         for S in S_values:
             arr = arr_original.copy()
+            t0 = time.perf_counter()
             comps = hybrid_sort(arr, 0, n - 1, S)
+            t1 = time.perf_counter()
+            if sink:
+                sink.write("optimal_S", n=n, S=S, comparisons=comps, time_s=t1 - t0)
             if comps < best_comps:
                 best_comps = comps
                 best_S = S
@@ -68,7 +80,7 @@ def experiment_optimal_S(sizes, S_values):
 
 # ── Experiment (d): hybrid vs merge_sort on 10M ──────────────────────────────
 
-def experiment_compare(S, n=10_000_000):
+def experiment_compare(S, n=10_000_000, *, sink=None):
     """Compare hybrid_sort vs merge_sort on n elements."""
     arr = generate_array(n)
 
@@ -76,11 +88,15 @@ def experiment_compare(S, n=10_000_000):
     t0 = time.time()
     comps_hybrid = hybrid_sort(arr1, 0, n - 1, S)
     t1 = time.time()
+    if sink:
+        sink.write("compare", "hybrid", n=n, S=S, comparisons=comps_hybrid, time_s=t1 - t0)
 
     arr2 = arr.copy()
     t2 = time.time()
     comps_merge = merge_sort(arr2, 0, n - 1)
     t3 = time.time()
+    if sink:
+        sink.write("compare", "merge", n=n, comparisons=comps_merge, time_s=t3 - t2)
 
     print(f"\n{'':=<50}")
     print(f"  n = {n:,},  S = {S}")
@@ -89,28 +105,30 @@ def experiment_compare(S, n=10_000_000):
     print(f"{'':=<50}")
 
 
-# ── Plotting helpers ──────────────────────────────────────────────────────────
+# ── Experiment (e): top-k vs full sort ───────────────────────────────────────
 
-def plot_vary_n(sizes, comparisons, S):
-    plt.figure()
-    plt.plot(sizes, comparisons, marker='o')
-    plt.xlabel("Input size (n)")
-    plt.ylabel("Key comparisons")
-    plt.title(f"Hybrid sort comparisons vs n  (S={S})")
-    plt.tight_layout()
-    plt.savefig(f"plot_vary_n_S{S}.png")
-    plt.show()
-
-
-def plot_vary_S(S_values, comparisons, n):
-    plt.figure()
-    plt.plot(S_values, comparisons, marker='o')
-    plt.xlabel("Threshold S")
-    plt.ylabel("Key comparisons")
-    plt.title(f"Hybrid sort comparisons vs S  (n={n:,})")
-    plt.tight_layout()
-    plt.savefig(f"plot_vary_S_n{n}.png")
-    plt.show()
+def experiment_top_k(S, n, k_values, *, sink=None):
+    """Compare hybrid_partial_sort against a full hybrid_sort for each k.
+    Returns (k_values, comparisons_list, full_comparisons)."""
+    arr_original = generate_array(n)
+    arr = arr_original.copy()
+    t0 = time.perf_counter()
+    full = hybrid_sort(arr, 0, n - 1, S)
+    t1 = time.perf_counter()
+    if sink:
+        sink.write("top_k", "hybrid", n=n, S=S, k=n, comparisons=full, time_s=t1 - t0)
+    print(f"  full sort   comparisons={full:,}")
+    results = []
+    for k in k_values:
+        arr = arr_original.copy()
+        t0 = time.perf_counter()
+        comps = hybrid_partial_sort(arr, 0, n - 1, S, k)
+        t1 = time.perf_counter()
+        results.append(comps)
+        if sink:
+            sink.write("top_k", "hybrid_partial", n=n, S=S, k=k, comparisons=comps, time_s=t1 - t0)
+        print(f"  k={k:>9,}  comparisons={comps:,}  ({comps / full:.1%} of full)")
+    return k_values, results, full
 
 
 # ── Main ──────────────────────────────────────────────────────────────────────
@@ -119,18 +137,23 @@ if __name__ == "__main__":
     S_FIXED = 32          # fixed S for experiment (c-i)
     N_FIXED = 100_000     # fixed n for experiment (c-ii)
     S_VALUES = list(range(1, 101))   # S from 1 to 100 for experiments
+    RESULTS_PATH = "results_experiment.csv"
+
+    with ResultsSink(RESULTS_PATH) as sink:
+        print("=== (c-i) Fixed S, vary n ===")
+        experiment_vary_n(S=S_FIXED, sink=sink)
+
+        print("\n=== (c-ii) Fixed n, vary S ===")
+        experiment_vary_S(n=N_FIXED, S_values=S_VALUES, sink=sink)
 
-    print("=== (c-i) Fixed S, vary n ===")
-    sizes, comps = experiment_vary_n(S=S_FIXED)
-    plot_vary_n(sizes, comps, S=S_FIXED)
+        print("\n=== (c-iii) Optimal S per size ===")
+        small_sizes = [1_000, 5_000, 10_000, 50_000, 100_000]
+        experiment_optimal_S(sizes=small_sizes, S_values=S_VALUES, sink=sink)
 
-    print("\n=== (c-ii) Fixed n, vary S ===")
-    s_vals, comps2 = experiment_vary_S(n=N_FIXED, S_values=S_VALUES)
-    plot_vary_S(s_vals, comps2, n=N_FIXED)
+        print("\n=== (d) Hybrid vs Mergesort on 10M ===")
+        experiment_compare(S=S_FIXED, sink=sink)
 
-    print("\n=== (c-iii) Optimal S per size ===")
-    small_sizes = [1_000, 5_000, 10_000, 50_000, 100_000]
-    optimal = experiment_optimal_S(sizes=small_sizes, S_values=S_VALUES)
+        print("\n=== (e) Top-k vs full sort ===")
+        experiment_top_k(S=S_FIXED, n=N_FIXED, k_values=[1, 10, 100, 1_000, 10_000, N_FIXED], sink=sink)
 
-    print("\n=== (d) Hybrid vs Mergesort on 10M ===")
-    experiment_compare(S=S_FIXED)
+    print(f"\nResults streamed to '{RESULTS_PATH}'; plot them with: python render.py {RESULTS_PATH}")
@@ -0,0 +1,342 @@
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+from algorithms import hybrid_sort
+from results import load_results
+
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+HISTORY_PATH = os.path.join(SCRIPT_DIR, "bench_history.jsonl")
+KEY_FIELDS = ("machine", "backend", "n", "S", "distribution", "seed")
+DISTRIBUTIONS = ("random", "sorted", "reversed", "few_unique")
+
+
+# ── Run identity ─────────────────────────────────────────────────────────────
+
+def current_commit():
+    """Return the short hash of this checkout's HEAD, suffixed with -dirty for
+    uncommitted changes. git runs in the script's directory, not the caller's."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=SCRIPT_DIR,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=SCRIPT_DIR,
+                               capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return commit + "-dirty" if dirty else commit
+
+
+def _resolve_commit(commit):
+    # entries filed under "unknown" would pool timings from unrelated trees
+    commit = commit or current_commit()
+    if commit == "unknown":
+        raise ValueError("could not determine the git commit of this checkout; "
+                         "pass --commit to record anyway")
+    return commit
+
+
+def machine_fingerprint():
+    """Return a short stable hash of the host and interpreter."""
+    parts = [platform.node(), platform.system(), platform.machine(), platform.processor(),
+             str(os.cpu_count()), platform.python_implementation(), platform.python_version()]
+    return hashlib.sha1("|".join(parts).encode()).hexdigest()[:12]
+
+
+# ── Data generation ──────────────────────────────────────────────────────────
+
+def generate_input(n, distribution, seed=0, x=10_000_000):
+    """Return a reproducible list of n integers drawn from the named distribution."""
+    rng = random.Random(seed)
+    if distribution == "random":
+        return [rng.randint(1, x) for _ in range(n)]
+    if distribution == "sorted":
+        return sorted(rng.randint(1, x) for _ in range(n))
+    if distribution == "reversed":
+        return sorted((rng.randint(1, x) for _ in range(n)), reverse=True)
+    if distribution == "few_unique":
+        return [rng.randint(1, 10) for _ in range(n)]
+    raise ValueError(f"unknown distribution {distribution!r}, expected one of {DISTRIBUTIONS}")
+
+
+# ── Store ────────────────────────────────────────────────────────────────────
+
+def record(entry, path=HISTORY_PATH):
+    """Append one benchmark entry to the history store."""
+    with open(path, "a") as f:
+        f.write(json.dumps(entry) + "\n")
+
+
+def load_history(path=HISTORY_PATH):
+    """Return all stored entries, oldest first."""
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def run_benchmark(n, S, distribution="random", repeats=5, seed=0, path=HISTORY_PATH, commit=None):
+    """Time hybrid_sort on a fixed input `repeats` times and append the result.
+    Raises ValueError if commit is not given and HEAD cannot be determined.
+    Returns the stored entry."""
+    commit = _resolve_commit(commit)
+    base = generate_input(n, distribution, seed)
+    times = []
+    comps = None
+    for _ in range(repeats):
+        arr = base.copy()
+        t0 = time.perf_counter()
+        comps = hybrid_sort(arr, 0, n - 1, S)
+        times.append(time.perf_counter() - t0)
+
+    entry = {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "machine": machine_fingerprint(),
+        "backend": "python",
+        "n": n,
+        "S": S,
+        "distribution": distribution,
+        "seed": seed,
+        "comparisons": comps,
+        "times": times,
+    }
+    record(entry, path)
+    print(f"  n={n:>10,}  S={S:>4}  {distribution:<10}  comparisons={comps:,}  "
+          f"median={statistics.median(times):.4f}s  commit={entry['commit']}")
+    return entry
+
+
+def import_results(results_paths, commit=None, path=HISTORY_PATH):
+    """Append timed hybrid/merge cells from results files (e.g. the results_cpp.csv
+    written by cpp/main.cpp) to the history store, one entry per key.
+    merge_sort cells are stored as S=1, which is the same algorithm.
+    Cells from different experiments at the same n and S sorted different unseeded
+    arrays, so their timings are pooled but no comparison count is stored
+    (seed=None, comparisons=None) and compare checks these entries for time only. main.cpp times each cell once, so import several runs per
+    commit before the time test can reach significance.
+    Raises ValueError if commit is not given and HEAD cannot be determined.
+    Returns the stored entries."""
+    commit = _resolve_commit(commit)
+    timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    machine = machine_fingerprint()
+    entries = {}
+    for r in load_results(results_paths):
+        if r["algorithm"] not in ("hybrid", "merge") or r["time_s"] is None:
+            continue
+        S = 1 if r["algorithm"] == "merge" else r["S"]
+        entry = entries.setdefault((r["backend"], r["n"], S), {
+            "commit": commit,
+            "timestamp": timestamp,
+            "machine": machine,
+            "backend": r["backend"],
+            "n": r["n"],
+            "S": S,
+            "distribution": "random",
+            "seed": None,
+            "comparisons": None,
+            "times": [],
+        })
+        entry["times"].append(r["time_s"])
+    for entry in entries.values():
+        record(entry, path)
+    print(f"  imported {len(entries)} entries from {', '.join(results_paths)}  commit={commit}")
+    return list(entries.values())
+
+
+# ── Statistics ───────────────────────────────────────────────────────────────
+
+def permutation_pvalue(base, cand, max_exact=20_000, samples=20_000, seed=0):
+    """One-sided p-value that mean(cand) > mean(base) by chance alone.
+    Enumerates every relabelling when feasible, otherwise samples them."""
+    if not base or not cand:
+        return 1.0
+    pooled = list(base) + list(cand)
+    k = len(cand)
+    observed = statistics.fmean(cand) - statistics.fmean(base)
+    total = sum(pooled)
+
+    def diff(idx):
+        s = sum(pooled[i] for i in idx)
+        return s / k - (total - s) / (len(pooled) - k)
+
+    n_comb = 1
+    for i in range(k):
+        n_comb = n_comb * (len(pooled) - i) // (i + 1)
+    if n_comb <= max_exact:
+        hits = sum(diff(idx) >= observed - 1e-12
+                   for idx in itertools.combinations(range(len(pooled)), k))
+        return hits / n_comb
+    rng = random.Random(seed)
+    hits = sum(diff(rng.sample(range(len(pooled)), k)) >= observed - 1e-12
+               for _ in range(samples))
+    return (hits + 1) / (samples + 1)
+
+
+# ── Compare and trend ────────────────────────────────────────────────────────
+
+def _group(entries):
+    groups = {}
+    for e in entries:
+        groups.setdefault(tuple(e.get(f) for f in KEY_FIELDS), []).append(e)
+    return groups
+
+
+def _sort_key(key):
+    # orders numerically (S=8 before S=16) and keeps None fields from breaking the sort
+    return tuple((v is None, v) for v in key)
+
+
+class NothingToCompare(Exception):
+    """Raised when the baseline and candidate share no benchmark keys."""
+
+
+def _missing_commit(commit, commits):
+    hint = f"; did you mean '{commit}-dirty'?" if f"{commit}-dirty" in commits else ""
+    return f"no history entries for commit '{commit}'{hint}"
+
+
+def compare(baseline, candidate=None, alpha=0.05, min_slowdown=0.02, path=HISTORY_PATH):
+    """Flag time or comparison regressions of `candidate` against `baseline`.
+    A time regression needs p < alpha and a median slowdown above min_slowdown.
+    Any increase in comparisons on the same seeded input is a regression;
+    unseeded (imported) entries are only checked for time.
+    Raises NothingToCompare if either commit has no entries or they share no keys.
+    Returns list of regression dicts."""
+    candidate = candidate or current_commit()
+    entries = load_history(path)
+    commits = {e["commit"] for e in entries}
+    base_groups = _group(e for e in entries if e["commit"] == baseline)
+    cand_groups = _group(e for e in entries if e["commit"] == candidate)
+    if not base_groups:
+        raise NothingToCompare(_missing_commit(baseline, commits))
+    if not cand_groups:
+        raise NothingToCompare(_missing_commit(candidate, commits))
+    if not base_groups.keys() & cand_groups.keys():
+        raise NothingToCompare(f"'{baseline}' and '{candidate}' share no benchmark keys "
+                               f"({', '.join(KEY_FIELDS)})")
+
+    regressions = []
+    print(f"Comparing {candidate} against baseline {baseline}")
+    print(f"{'machine':<12} {'backend':<8} {'n':>10} {'S':>4} {'distribution':<12} {'seed':>6} "
+          f"{'time Δ':>8} {'p':>6} {'comps Δ':>10}  status")
+    for key in sorted(base_groups.keys() & cand_groups.keys(), key=_sort_key):
+        b_times = [t for e in base_groups[key] for t in e["times"]]
+        c_times = [t for e in cand_groups[key] for t in e["times"]]
+        b_med, c_med = statistics.median(b_times), statistics.median(c_times)
+        slowdown = (c_med - b_med) / b_med if b_med else 0.0
+        p = permutation_pvalue(b_times, c_times)
+        b_comps = base_groups[key][-1]["comparisons"]
+        c_comps = cand_groups[key][-1]["comparisons"]
+
+        status = []
+        if p < alpha and slowdown > min_slowdown:
+            status.append("TIME")
+        counted = b_comps is not None and c_comps is not None
+        if counted and c_comps > b_comps:
+            status.append("COMPARISONS")
+        if status:
+            regressions.append({"key": dict(zip(KEY_FIELDS, key)), "slowdown": slowdown,
+                                "p": p, "baseline_comparisons": b_comps,
+                                "candidate_comparisons": c_comps, "kinds": status})
+        machine, backend, n, S, dist, seed = key
+        print(f"{machine:<12} {backend:<8} {n:>10,} {S:>4} {dist:<12} {seed!s:>6} "
+              f"{slowdown:>+8.1%} {p:>6.3f} {f'{c_comps - b_comps:+,}' if counted else '-':>10}  "
+              f"{'REGRESSION ' + '+'.join(status) if status else 'ok'}")
+
+    missing = sorted(base_groups.keys() - cand_groups.keys(), key=_sort_key)
+    if missing:
+        print(f"\n{len(missing)} baseline key(s) not benchmarked for {candidate}:")
+        for machine, backend, n, S, dist, seed in missing:
+            print(f"  {machine:<12} {backend:<8} {n:>10,} {S:>4} {dist:<12} {seed!s:>6}")
+    return regressions
+
+
+def _fmt_count(comps):
+    return "-" if comps is None else f"{comps:,}"
+
+
+def trend(path=HISTORY_PATH, out=None):
+    """Print (and optionally write) a markdown table of median time and comparisons
+    per commit for every benchmark key, oldest commit first."""
+    lines = []
+    for key, group in sorted(_group(load_history(path)).items(), key=lambda kv: _sort_key(kv[0])):
+        machine, backend, n, S, dist, seed = key
+        lines.append(f"\n### {backend}  n={n:,}  S={S}  {dist}  seed={seed}  (machine {machine})\n")
+        lines.append("| commit | date | median time (s) | Δ vs first | comparisons |")
+        lines.append("|---|---|---|---|---|")
+        by_commit = {}
+        for e in group:
+            by_commit.setdefault(e["commit"], []).append(e)
+        first = None
+        for commit, runs in by_commit.items():
+            med = statistics.median(t for e in runs for t in e["times"])
+            first = first if first is not None else med
+            change = (med - first) / first if first else 0.0
+            lines.append(f"| {commit} | {runs[-1]['timestamp'][:10]} | {med:.4f} | "
+                         f"{change:+.1%} | {_fmt_count(runs[-1]['comparisons'])} |")
+    report = "\n".join(lines)
+    print(report)
+    if out:
+        with open(out, "w") as f:
+            f.write("# Benchmark trend\n" + report + "\n")
+    return report
+
+
+# ── Main ──────────────────────────────────────────────────────────────────────
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark history for hybrid_sort")
+    parser.add_argument("--history", default=HISTORY_PATH)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_run = sub.add_parser("run", help="benchmark the current tree and append to history")
+    p_run.add_argument("-n", type=int, nargs="+", default=[10_000, 100_000])
+    p_run.add_argument("-S", type=int, nargs="+", default=[32])
+    p_run.add_argument("-d", "--distribution", nargs="+", default=["random"], choices=DISTRIBUTIONS)
+    p_run.add_argument("-r", "--repeats", type=int, default=5)
+    p_run.add_argument("--commit", help="commit to file the results under (default: HEAD)")
+
+    p_imp = sub.add_parser("import", help="record timings from results files, e.g. results_cpp.csv")
+    p_imp.add_argument("results", nargs="+")
+    p_imp.add_argument("--commit", help="commit to file the results under (default: HEAD)")
+
+    p_cmp = sub.add_parser("compare", help="flag regressions against a baseline commit")
+    p_cmp.add_argument("baseline")
+    p_cmp.add_argument("candidate", nargs="?")
+    p_cmp.add_argument("--alpha", type=float, default=0.05)
+    p_cmp.add_argument("--min-slowdown", type=float, default=0.02)
+
+    p_trend = sub.add_parser("trend", help="print a per-commit trend report")
+    p_trend.add_argument("-o", "--out")
+
+    args = parser.parse_args()
+    try:
+        if args.command == "run":
+            commit = _resolve_commit(args.commit)
+            for n in args.n:
+                for S in args.S:
+                    for dist in args.distribution:
+                        run_benchmark(n, S, dist, args.repeats, path=args.history, commit=commit)
+        elif args.command == "import":
+            import_results(args.results, args.commit, args.history)
+    except ValueError as e:
+        print(f"error: {e}")
+        raise SystemExit(2)
+
+    if args.command == "compare":
+        try:
+            found = compare(args.baseline, args.candidate, args.alpha, args.min_slowdown, args.history)
+        except NothingToCompare as e:
+            print(f"error: {e}")
+            raise SystemExit(2)
+        raise SystemExit(1 if found else 0)
+    elif args.command == "trend":
+        trend(args.history, args.out)
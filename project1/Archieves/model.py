@@ -0,0 +1,150 @@
+import math
+import time
+from functools import lru_cache
+
+
+# ── Leaf and merge costs ─────────────────────────────────────────────────────
+# Counts follow the kernels in algorithms.py exactly. Expected values assume a
+# uniformly random permutation of distinct keys.
+
+def _harmonic(m):
+    """Return H_m = 1 + 1/2 + ... + 1/m."""
+    if m <= 1_000:
+        return sum(1 / i for i in range(1, m + 1))
+    return math.log(m) + 0.5772156649015329 + 1 / (2 * m) - 1 / (12 * m * m)
+
+
+def insertion_best(m):
+    # already sorted: one failed comparison per inserted item
+    return max(m - 1, 0)
+
+
+def insertion_worst(m):
+    # reversed: item i shifts past all i items before it, and the loop ends on j < left
+    return m * (m - 1) // 2
+
+
+def insertion_expected(m):
+    # item i shifts t ~ U{0..i} places, plus one stopping comparison unless t == i
+    if m <= 1:
+        return 0.0
+    return m * (m - 1) / 4 + m - _harmonic(m)
+
+
+def merge_best(n1, n2):
+    return min(n1, n2)
+
+
+def merge_worst(n1, n2):
+    return n1 + n2 - 1
+
+
+def merge_expected(n1, n2):
+    # the loop ends when one run is exhausted; the other run's tail is copied free
+    return n1 + n2 - n1 / (n2 + 1) - n2 / (n1 + 1)
+
+
+# ── Recursion over the split tree ────────────────────────────────────────────
+# hybrid_sort only ever sees two distinct sizes per level, so memoising on
+# (n, S) makes every prediction O(log n).
+
+@lru_cache(maxsize=None)
+def _predict(n, S, case):
+    if n <= S or n <= 1:
+        return {"best": insertion_best, "worst": insertion_worst,
+                "expected": insertion_expected}[case](n)
+    n1 = (n + 1) // 2
+    n2 = n - n1
+    merge_cost = {"best": merge_best, "worst": merge_worst,
+                  "expected": merge_expected}[case](n1, n2)
+    return _predict(n1, S, case) + _predict(n2, S, case) + merge_cost
+
+
+def predict_hybrid(n, S):
+    """Predicted comparisons for hybrid_sort on n items with threshold S.
+    Returns dict with exact 'best' and 'worst' and the 'expected' value."""
+    return {case: _predict(n, S, case) for case in ("best", "worst", "expected")}
+
+
+def predict_merge_sort(n):
+    """Predicted comparisons for merge_sort on n items (hybrid_sort with S=1)."""
+    return predict_hybrid(n, 1)
+
+
+def model_vary_n(S, sizes):
+    """Analytic counterpart of experiment_vary_n.
+    Returns (sizes, expected_comparisons_list)."""
+    return sizes, [predict_hybrid(n, S)["expected"] for n in sizes]
+
+
+def model_vary_S(n, S_values):
+    """Analytic counterpart of experiment_vary_S.
+    Returns (S_values, expected_comparisons_list)."""
+    return S_values, [predict_hybrid(n, S)["expected"] for S in S_values]
+
+
+def model_optimal_S(sizes, S_values):
+    """Analytic counterpart of experiment_optimal_S.
+    Returns dict {n: optimal_S}."""
+    return {n: min(S_values, key=lambda S: predict_hybrid(n, S)["expected"])
+            for n in sizes}
+
+
+# ── Validation against empirical runs ────────────────────────────────────────
+
+def _report(label, values, measured, predicted):
+    errors = []
+    for v, m, p in zip(values, measured, predicted):
+        err = (m - p) / p * 100 if p else 0.0
+        errors.append(err)
+        print(f"  {label}={v:>10,}  measured={m:>14,}  predicted={p:>16,.1f}  error={err:+.3f}%")
+    worst = max(errors, key=abs) if errors else 0.0
+    print(f"  max |error| = {abs(worst):.3f}%")
+    return errors
+
+
+def validate_vary_n(S, sizes):
+    """Run experiment_vary_n on the sampled sizes and compare with the model.
+    Returns list of relative errors in percent."""
+    from experiment import experiment_vary_n
+    _, measured = experiment_vary_n(S, sizes)
+    _, predicted = model_vary_n(S, sizes)
+    return _report("n", sizes, measured, predicted)
+
+
+def validate_vary_S(n, S_values):
+    """Run experiment_vary_S on the sampled thresholds and compare with the model.
+    Returns list of relative errors in percent."""
+    from experiment import experiment_vary_S
+    _, measured = experiment_vary_S(n, S_values)
+    _, predicted = model_vary_S(n, S_values)
+    return _report("S", S_values, measured, predicted)
+
+
+# ── Main ──────────────────────────────────────────────────────────────────────
+
+if __name__ == "__main__":
+    S_FIXED = 32
+    N_FIXED = 100_000
+
+    print("=== Validation: fixed S, vary n ===")
+    validate_vary_n(S_FIXED, [1_000, 10_000, 100_000, 1_000_000])
+
+    print("\n=== Validation: fixed n, vary S ===")
+    validate_vary_S(N_FIXED, [1, 2, 4, 8, 16, 32, 64])
+
+    print("\n=== Model only: fixed S, vary n ===")
+    big_sizes = [10 ** e for e in range(3, 13)]
+    t0 = time.perf_counter()
+    _, expected = model_vary_n(S_FIXED, big_sizes)
+    t1 = time.perf_counter()
+    for n, e in zip(big_sizes, expected):
+        p = predict_hybrid(n, S_FIXED)
+        print(f"  n={n:>18,}  best={p['best']:>20,}  expected={e:>24,.0f}  worst={p['worst']:>20,}")
+    print(f"  ({(t1 - t0) * 1e6:.0f} us for {len(big_sizes)} sizes)")
+
+    print("\n=== Model only: hybrid vs merge_sort ===")
+    for n in [10_000_000, 1_000_000_000]:
+        h = predict_hybrid(n, S_FIXED)["expected"]
+        m = predict_merge_sort(n)["expected"]
+        print(f"  n={n:>13,}  hybrid(S={S_FIXED})={h:,.0f}  merge_sort={m:,.0f}")
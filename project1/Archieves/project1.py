@@ -6,9 +6,8 @@ Remove or comment out 10M and 1M in the array as it will run for some time.
 
 import random
 import time
-import matplotlib.pyplot as plt
-import numpy as np
 from typing import List, Tuple
+from results import ResultsSink
 
 
 # ============================================================================
@@ -44,7 +43,7 @@ def merge(arr, left, mid, right):
     i, j, k = 0, 0, left
 
     while i < n1 and j < n2:
-        if L[i] < R[j]:
+        if L[i] <= R[j]:
             arr[k] = L[i]
             i += 1
         else:
@@ -176,10 +175,11 @@ def generate_random_arr(size: int, max_value: int = None) -> List:
 """
 (c) i. Analyze with fixed threshold, varying input sizes
 """
-def analyze_fixed_threshold(sizes: List[int], threshold: int = 10, max_value: int = 1000000) -> Tuple[List[int], List[int]]:
+def analyze_fixed_threshold(sizes: List[int], threshold: int = 10, max_value: int = 1000000,
+                            *, sink: ResultsSink = None) -> Tuple[List[int], List[int]]:
     """
     Analyze performance with fixed threshold across different input sizes.
-    Returns (sizes, comparisons_list)
+    Returns (sizes, comparisons_list); each size is also streamed to sink.
     """
     comp_counts = []
     
@@ -187,18 +187,23 @@ def analyze_fixed_threshold(sizes: List[int], threshold: int = 10, max_value: in
         print(f"Analyzing size {size} with threshold {threshold}")
         arr = generate_random_arr(size, max_value)
         arr_copy = arr.copy()
+        t0 = time.perf_counter()
         comps = hybrid_sort(arr_copy, 0, len(arr_copy) - 1, threshold)
+        t = time.perf_counter() - t0
         comp_counts.append(comps)
+        if sink:
+            sink.write("vary_n", n=size, S=threshold, comparisons=comps, time_s=t)
     
     return sizes, comp_counts
 
 """
 (c) ii. Analyze with fixed input size, varying thresholds
 """
-def analyze_fixed_size(size: int, thresholds: List[int], max_value: int = 1000000) -> Tuple[List[int], List[int]]:
+def analyze_fixed_size(size: int, thresholds: List[int], max_value: int = 1000000,
+                       *, sink: ResultsSink = None) -> Tuple[List[int], List[int]]:
     """
     Analyze performance with fixed size across different thresholds.
-    Returns (thresholds, comparisons_list)
+    Returns (thresholds, comparisons_list); each threshold is also streamed to sink.
     """
     comp_counts = []
     # Generate one array and use it for all threshold tests
@@ -207,8 +212,12 @@ def analyze_fixed_size(size: int, thresholds: List[int], max_value: int = 100000
     for threshold in thresholds:
         print(f"Analyzing threshold {threshold} with size {size}")
         arr_copy = arr.copy()
+        t0 = time.perf_counter()
         comps = hybrid_sort(arr_copy, 0, len(arr_copy) - 1, threshold)
+        t = time.perf_counter() - t0
         comp_counts.append(comps)
+        if sink:
+            sink.write("vary_S", n=size, S=threshold, comparisons=comps, time_s=t)
     
     return thresholds, comp_counts
 
@@ -219,7 +228,7 @@ takes around 1 min + to run with 10mil
 """
 
 
-def run_analysis_c_i_ii():
+def run_analysis_c_i_ii(*, sink: ResultsSink = None):
 
     # Define test parameters
     size_of_arr = [1000, 2000, 5000, 10000, 20000, 50000, 100000, 500000]
@@ -231,40 +240,11 @@ def run_analysis_c_i_ii():
 
     # (c)i: fixed threshold 10, varying sizes
     print("\n(c)i: Analysis with fixed threshold X=10")
-    sizes_fixed_s, comparisons_fixed_s = analyze_fixed_threshold(size_of_arr, 10)
+    sizes_fixed_s, comparisons_fixed_s = analyze_fixed_threshold(size_of_arr, 10, sink=sink)
 
     # (c)ii: fixed size 20k, varying thresholds
     print("\n(c)ii: Analysis with fixed size n=20000")
-    thresholds_fixed_n, comparisons_fixed_n = analyze_fixed_size(20000, thresholds)
-
-    # ---- PLOTS (only two panels) ----
-    plt.figure(figsize=(12, 5))
-
-    # left plot: (c)i
-    plt.subplot(1, 2, 1)
-    plt.plot(sizes_fixed_s, comparisons_fixed_s, 'bo-', markersize=6, linewidth=2, label='Hybrid (X=10)')
-    plt.xlabel('Input Size (n)')
-    plt.ylabel('Key Comparisons')
-    plt.title('Key Comparisons vs Input Size (X=10)')
-    plt.grid(True, alpha=0.3)
-
-    theoretical = [n * np.log2(n) for n in sizes_fixed_s]  
-    plt.plot(sizes_fixed_s, theoretical, 'r--', alpha=0.7, linewidth=2, label='O(n log n)')
-    plt.legend()
-
-    # right plot: (c)ii
-    plt.subplot(1, 2, 2)
-    plt.plot(thresholds_fixed_n, comparisons_fixed_n, 'go-', markersize=6, linewidth=2)
-    plt.xlabel('Threshold (S)')
-    plt.ylabel('Key Comparisons')
-    plt.title('Key Comparisons vs Threshold (n=20,000)')
-    plt.grid(True, alpha=0.3)
-
-
-    plt.tight_layout()
-    plt.savefig('hybrid_mergesort_c_i_ii.png', dpi=300, bbox_inches='tight')
-    print("\nPlots saved to 'hybrid_mergesort_c_i_ii.png'")
-
+    thresholds_fixed_n, comparisons_fixed_n = analyze_fixed_size(20000, thresholds, sink=sink)
 
     # print for (c)i and (c)ii)
     print("\n" + "="*60)
@@ -291,7 +271,8 @@ Takes around 2 min to run 1M, 9 min to run 10M. Optimal s=3
 """
 def run_analysis_c_iii(
     max_value: int = 10_000_000,
-    save_path: str = "hybrid_mergesort_c_iii.png",
+    *,
+    sink: ResultsSink = None,
 ):
     """Find optimal threshold for each input size (1 trial per (n,S))."""
     size_of_arr = [1000, 2000, 5000, 10000, 20000, 50000, 100000, 500000, 1000000, 10000000]
@@ -312,8 +293,12 @@ def run_analysis_c_iii(
 
         for S in thresholds:
             arr = base_arr.copy()
+            t0 = time.perf_counter()
             comps = hybrid_sort(arr, 0, len(arr) - 1, S)
+            t = time.perf_counter() - t0
             all_results.append((S, comps))
+            if sink:
+                sink.write("optimal_S", n=n, S=S, comparisons=comps, time_s=t)
             if comps < min_comparisons:
                 min_comparisons = comps
                 best_S = S
@@ -324,37 +309,7 @@ def run_analysis_c_iii(
             "all_results": all_results,
         }
 
-    # ---- Plotting ----
     ns_sorted = sorted(results.keys())
-    optimal_S = [results[k]["optimal_threshold"] for k in ns_sorted]
-    min_comps = [results[k]["min_comparisons"] for k in ns_sorted]
-
-    plt.figure(figsize=(12, 5))
-
-    # Left: Optimal S vs n
-    plt.subplot(1, 2, 1)
-    x_pos = np.arange(len(ns_sorted))
-    bars = plt.bar(x_pos, optimal_S, width=0.6, alpha=0.85)
-    plt.xticks(x_pos, [f"{n:,}" for n in ns_sorted])
-    plt.xlabel("Input Size n")
-    plt.ylabel("Optimal Threshold S*")
-    plt.title("Optimal Threshold S* vs Input Size n")
-    plt.grid(True, axis="y", alpha=0.3)
-    for b, s in zip(bars, optimal_S):
-        plt.text(b.get_x() + b.get_width()/2, b.get_height() + 0.2, str(s),
-                 ha="center", va="bottom", fontweight="bold", fontsize=9)
-
-    # Right: Min comparisons vs n
-    plt.subplot(1, 2, 2)
-    plt.plot(ns_sorted, min_comps, "o-", linewidth=2, markersize=6)
-    plt.xlabel("Input Size n")
-    plt.ylabel("Minimum Key Comparisons (at S*)")
-    plt.title("Minimum Comparisons vs Input Size n")
-    plt.grid(True, alpha=0.3)
-
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches="tight")
-    print(f"\nPlots saved to '{save_path}'")
 
     # Summary table
     print("\nSUMMARY (c)iii:  (1 trial)")
@@ -374,8 +329,9 @@ Not much difference in comparisons but shows CPU time reduction.
 def run_analysis_d(optimal_S: int = 3,
                    n: int = 10_000_000,
                    max_value: int = 10_000_000,
-                   save_path: str = "part_d_comparison.png",
-                   verify_sorted: bool = False):
+                   verify_sorted: bool = False,
+                   *,
+                   sink: ResultsSink = None):
 
     print("\n" + "="*60)
     print(f"(d) Comparing Hybrid(S={optimal_S}) vs Pure Mergesort on n={n:,}")
@@ -388,6 +344,8 @@ def run_analysis_d(optimal_S: int = 3,
     t0 = time.perf_counter()
     comps_h = hybrid_sort(arr_h, 0, len(arr_h) - 1, optimal_S)
     t_h = time.perf_counter() - t0
+    if sink:
+        sink.write("compare", "hybrid", n=n, S=optimal_S, comparisons=comps_h, time_s=t_h)
     if verify_sorted:
         print("Hybrid sorted:", arr_h == sorted(arr_h))
 
@@ -396,6 +354,8 @@ def run_analysis_d(optimal_S: int = 3,
     t0 = time.perf_counter()
     comps_p = merge_sort(arr_p, 0, len(arr_p) - 1)
     t_p = time.perf_counter() - t0
+    if sink:
+        sink.write("compare", "merge", n=n, comparisons=comps_p, time_s=t_p)
     if verify_sorted:
         print("Pure sorted:", arr_p == sorted(arr_p))
 
@@ -412,38 +372,6 @@ def run_analysis_d(optimal_S: int = 3,
     print(f"Comparisons: {comp_impr:.2f}% reduction")
     print(f"CPU Time:   {time_impr:.2f}% reduction")
 
-    # Plot (bar charts)
-    labels = [f"Hybrid\n(S={optimal_S})", "Pure"]
-    comps = [comps_h, comps_p]
-    times = [t_h, t_p]
-
-    plt.figure(figsize=(12, 5))
-
-    # Left: comparisons
-    plt.subplot(1, 2, 1)
-    x = np.arange(len(labels))
-    bars1 = plt.bar(x, comps, width=0.6, alpha=0.85)
-    plt.xticks(x, labels)
-    plt.ylabel("Key Comparisons")
-    plt.title(f"Comparisons (n={n:,})")
-    plt.grid(True, axis="y", alpha=0.3)
-    for b, v in zip(bars1, comps):
-        plt.text(b.get_x()+b.get_width()/2, v*1.01, f"{v:,}", ha="center", va="bottom", fontsize=9)
-
-    # Right: time
-    plt.subplot(1, 2, 2)
-    bars2 = plt.bar(x, times, width=0.6, alpha=0.85)
-    plt.xticks(x, labels)
-    plt.ylabel("CPU Time (s)")
-    plt.title(f"CPU Time (n={n:,})")
-    plt.grid(True, axis="y", alpha=0.3)
-    for b, v in zip(bars2, times):
-        plt.text(b.get_x()+b.get_width()/2, v*1.01, f"{v:.2f}s", ha="center", va="bottom", fontsize=9)
-
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches="tight")
-    print(f"\nPlot saved to '{save_path}'")
-
     return {
         "hybrid": {"comparisons": comps_h, "time": t_h, "S": optimal_S},
         "pure": {"comparisons": comps_p, "time": t_p},
@@ -458,8 +386,9 @@ Not much difference in comparisons but shows CPU time reduction.
 def run_analysis_d_buffered(optimal_S: int = 3,
                             n: int = 10_000_000,
                             max_value: int = 10_000_000,
-                            save_path: str = "part_d_comparison_buffered.png",
-                            verify_sorted: bool = False):
+                            verify_sorted: bool = False,
+                            *,
+                            sink: ResultsSink = None):
     """
     Compare buffered hybrid vs pure mergesort on n elements.
     Measures key comparisons and CPU time on the same dataset.
@@ -475,6 +404,8 @@ def run_analysis_d_buffered(optimal_S: int = 3,
     t0 = time.perf_counter()
     comps_h = hybrid_sort_buffered(arr_h, 0, len(arr_h) - 1, optimal_S)
     t_h = time.perf_counter() - t0
+    if sink:
+        sink.write("compare", "hybrid_buffered", n=n, S=optimal_S, comparisons=comps_h, time_s=t_h)
     if verify_sorted:
         print("Hybrid sorted:", arr_h == sorted(arr_h))
 
@@ -483,6 +414,8 @@ def run_analysis_d_buffered(optimal_S: int = 3,
     t0 = time.perf_counter()
     comps_p = merge_sort_buffered(arr_p, 0, len(arr_p) - 1)
     t_p = time.perf_counter() - t0
+    if sink:
+        sink.write("compare", "merge_buffered", n=n, comparisons=comps_p, time_s=t_p)
     if verify_sorted:
         print("Pure sorted:", arr_p == sorted(arr_p))
 
@@ -499,35 +432,6 @@ def run_analysis_d_buffered(optimal_S: int = 3,
     print(f"Comparisons: {comp_impr:.2f}% reduction")
     print(f"CPU Time:   {time_impr:.2f}% reduction")
 
-    # Plot
-    labels = [f"Hybrid\n(S={optimal_S})", "Pure"]
-    comps = [comps_h, comps_p]
-    times = [t_h, t_p]
-
-    plt.figure(figsize=(12, 5))
-    plt.subplot(1, 2, 1)
-    x = np.arange(len(labels))
-    bars1 = plt.bar(x, comps, width=0.6, alpha=0.85)
-    plt.xticks(x, labels)
-    plt.ylabel("Key Comparisons")
-    plt.title(f"Comparisons (n={n:,})")
-    plt.grid(True, axis="y", alpha=0.3)
-    for b, v in zip(bars1, comps):
-        plt.text(b.get_x()+b.get_width()/2, v*1.01, f"{v:,}", ha="center", va="bottom", fontsize=9)
-
-    plt.subplot(1, 2, 2)
-    bars2 = plt.bar(x, times, width=0.6, alpha=0.85)
-    plt.xticks(x, labels)
-    plt.ylabel("CPU Time (s)")
-    plt.title(f"CPU Time (n={n:,})")
-    plt.grid(True, axis="y", alpha=0.3)
-    for b, v in zip(bars2, times):
-        plt.text(b.get_x()+b.get_width()/2, v*1.01, f"{v:.2f}s", ha="center", va="bottom", fontsize=9)
-
-    plt.tight_layout()
-    plt.savefig(save_path, dpi=300, bbox_inches="tight")
-    print(f"\nPlot saved to '{save_path}'")
-
     return {
         "hybrid": {"comparisons": comps_h, "time": t_h, "S": optimal_S},
         "pure": {"comparisons": comps_p, "time": t_p},
@@ -536,9 +440,14 @@ def run_analysis_d_buffered(optimal_S: int = 3,
 
 
 if __name__ == "__main__":    
-    # run the main analysis
-    run_analysis_c_i_ii()
+    RESULTS_PATH = "results_project1.csv"
+
+    # run the main analysis, streaming every cell to RESULTS_PATH
+    with ResultsSink(RESULTS_PATH) as sink:
+        run_analysis_c_i_ii(sink=sink)
+
+        run_analysis_c_iii(sink=sink)
+        run_analysis_d(optimal_S=3, n=10_000_000, sink=sink, verify_sorted=False)
+        run_analysis_d_buffered(optimal_S=3, n=10_000_000, sink=sink, verify_sorted=False)
 
-    run_analysis_c_iii()
-    run_analysis_d(optimal_S=3, n=10_000_000, verify_sorted=False)
-    run_analysis_d_buffered(optimal_S=3, n=10_000_000, verify_sorted=False)
\ No newline at end of file
+    print(f"\nResults streamed to '{RESULTS_PATH}'; plot them with: python render.py {RESULTS_PATH}")
\ No newline at end of file
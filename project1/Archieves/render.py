@@ -0,0 +1,255 @@
+import glob
+import math
+import os
+import sys
+import matplotlib
+matplotlib.use("Agg")   # render to files only, never block on a window
+import matplotlib.pyplot as plt
+from results import load_results
+
+
+# ── Loading ──────────────────────────────────────────────────────────────────
+
+def load_sources(paths):
+    """Load every results file and tag each row with the file it came from."""
+    rows = []
+    for path in paths:
+        source = os.path.splitext(os.path.basename(path))[0]
+        for row in load_results([path]):
+            row["source"] = source
+            rows.append(row)
+    return rows
+
+
+def _select(rows, experiment, **match):
+    return [r for r in rows if r["experiment"] == experiment
+            and all(r[c] == v for c, v in match.items())]
+
+
+def _series(rows, group_by, x, y="comparisons"):
+    """Group rows into {group: (xs, ys)} sorted by x; one line per source/backend."""
+    groups = {}
+    for r in rows:
+        key = tuple(r[c] for c in group_by)
+        groups.setdefault(key, []).append((r[x], r[y]))
+    return {k: tuple(zip(*sorted(v))) for k, v in groups.items()}
+
+
+def _label(source, backend):
+    return f"{source} ({backend})"
+
+
+# ── Plots ────────────────────────────────────────────────────────────────────
+
+def plot_vary_n(rows):
+    """One figure per S: comparisons vs n, overlaying every source."""
+    rows = _select(rows, "vary_n")
+    for S in sorted({r["S"] for r in rows}):
+        plt.figure()
+        for (source, backend), (xs, ys) in _series(_select(rows, "vary_n", S=S),
+                                                   ("source", "backend"), "n").items():
+            plt.plot(xs, ys, marker='o', label=_label(source, backend))
+        plt.xlabel("Input size (n)")
+        plt.ylabel("Key comparisons")
+        plt.title(f"Hybrid sort comparisons vs n  (S={S})")
+        plt.legend()
+        plt.tight_layout()
+        plt.savefig(f"plot_vary_n_S{S}.png")
+        plt.close()
+        print(f"Saved 'plot_vary_n_S{S}.png'")
+
+
+def plot_vary_S(rows):
+    """One figure per n: comparisons vs S, overlaying every source."""
+    rows = _select(rows, "vary_S")
+    for n in sorted({r["n"] for r in rows}):
+        plt.figure()
+        for (source, backend), (xs, ys) in _series(_select(rows, "vary_S", n=n),
+                                                   ("source", "backend"), "S").items():
+            plt.plot(xs, ys, marker='o', label=_label(source, backend))
+        plt.xlabel("Threshold S")
+        plt.ylabel("Key comparisons")
+        plt.title(f"Hybrid sort comparisons vs S  (n={n:,})")
+        plt.legend()
+        plt.tight_layout()
+        plt.savefig(f"plot_vary_S_n{n}.png")
+        plt.close()
+        print(f"Saved 'plot_vary_S_n{n}.png'")
+
+
+def plot_c_i_ii(rows, save_path="hybrid_mergesort_c_i_ii.png"):
+    """Two panels: comparisons vs n against n log n, and comparisons vs S."""
+    vary_n = _select(rows, "vary_n")
+    vary_S = _select(rows, "vary_S")
+    plt.figure(figsize=(12, 5))
+
+    # left plot: (c)i
+    plt.subplot(1, 2, 1)
+    all_n = set()
+    for (source, backend, S), (xs, ys) in _series(vary_n, ("source", "backend", "S"), "n").items():
+        plt.plot(xs, ys, 'o-', markersize=6, linewidth=2, label=f"{_label(source, backend)} X={S}")
+        all_n.update(xs)
+    if all_n:
+        ns = sorted(all_n)
+        plt.plot(ns, [n * math.log2(n) for n in ns], 'r--', alpha=0.7, linewidth=2, label='O(n log n)')
+    plt.xlabel('Input Size (n)')
+    plt.ylabel('Key Comparisons')
+    plt.title('Key Comparisons vs Input Size')
+    plt.grid(True, alpha=0.3)
+    plt.legend()
+
+    # right plot: (c)ii
+    plt.subplot(1, 2, 2)
+    for (source, backend, n), (xs, ys) in _series(vary_S, ("source", "backend", "n"), "S").items():
+        plt.plot(xs, ys, 'o-', markersize=6, linewidth=2, label=f"{_label(source, backend)} n={n:,}")
+    plt.xlabel('Threshold (S)')
+    plt.ylabel('Key Comparisons')
+    plt.title('Key Comparisons vs Threshold')
+    plt.grid(True, alpha=0.3)
+    plt.legend()
+
+    plt.tight_layout()
+    plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    plt.close()
+    print(f"Saved '{save_path}'")
+
+
+def plot_optimal_S(rows, save_path="hybrid_mergesort_c_iii.png"):
+    """Optimal S* per n (bars) and the minimum comparisons reached at S*."""
+    best = {}
+    for r in _select(rows, "optimal_S"):
+        key = (r["source"], r["backend"], r["n"])
+        if key not in best or r["comparisons"] < best[key]["comparisons"]:
+            best[key] = r
+    sources = sorted({k[:2] for k in best})
+    ns_sorted = sorted({k[2] for k in best})
+
+    plt.figure(figsize=(12, 5))
+
+    # Left: Optimal S vs n
+    plt.subplot(1, 2, 1)
+    width = 0.6 / max(len(sources), 1)
+    for i, src in enumerate(sources):
+        x_pos = [j + (i - (len(sources) - 1) / 2) * width for j, n in enumerate(ns_sorted)
+                 if src + (n,) in best]
+        optimal_S = [best[src + (n,)]["S"] for n in ns_sorted if src + (n,) in best]
+        bars = plt.bar(x_pos, optimal_S, width=width, alpha=0.85, label=_label(*src))
+        for b, s in zip(bars, optimal_S):
+            plt.text(b.get_x() + b.get_width()/2, b.get_height() + 0.2, str(s),
+                     ha="center", va="bottom", fontweight="bold", fontsize=9)
+    plt.xticks(range(len(ns_sorted)), [f"{n:,}" for n in ns_sorted])
+    plt.xlabel("Input Size n")
+    plt.ylabel("Optimal Threshold S*")
+    plt.title("Optimal Threshold S* vs Input Size n")
+    plt.grid(True, axis="y", alpha=0.3)
+    plt.legend()
+
+    # Right: Min comparisons vs n
+    plt.subplot(1, 2, 2)
+    for src in sources:
+        ns = [n for n in ns_sorted if src + (n,) in best]
+        plt.plot(ns, [best[src + (n,)]["comparisons"] for n in ns], "o-",
+                 linewidth=2, markersize=6, label=_label(*src))
+    plt.xlabel("Input Size n")
+    plt.ylabel("Minimum Key Comparisons (at S*)")
+    plt.title("Minimum Comparisons vs Input Size n")
+    plt.grid(True, alpha=0.3)
+    plt.legend()
+
+    plt.tight_layout()
+    plt.savefig(save_path, dpi=300, bbox_inches="tight")
+    plt.close()
+    print(f"Saved '{save_path}'")
+
+
+def plot_compare(rows, algorithms=("hybrid", "merge"), save_path="part_d_comparison.png"):
+    """Bar charts of comparisons and CPU time for each algorithm and source."""
+    rows = [r for r in _select(rows, "compare") if r["algorithm"] in algorithms]
+    labels, comps, times = [], [], []
+    for r in rows:
+        name = "Hybrid" if r["algorithm"].startswith("hybrid") else "Pure"
+        s = f"\n(S={r['S']})" if r["S"] is not None else ""
+        labels.append(f"{name}{s}\n{r['source']} ({r['backend']})\nn={r['n']:,}")
+        comps.append(r["comparisons"])
+        times.append(r["time_s"])
+
+    plt.figure(figsize=(12, 5))
+
+    # Left: comparisons
+    plt.subplot(1, 2, 1)
+    x = range(len(labels))
+    bars1 = plt.bar(x, comps, width=0.6, alpha=0.85)
+    plt.xticks(x, labels)
+    plt.ylabel("Key Comparisons")
+    plt.title("Comparisons")
+    plt.grid(True, axis="y", alpha=0.3)
+    for b, v in zip(bars1, comps):
+        plt.text(b.get_x()+b.get_width()/2, v*1.01, f"{v:,}", ha="center", va="bottom", fontsize=9)
+
+    # Right: time
+    plt.subplot(1, 2, 2)
+    bars2 = plt.bar(x, times, width=0.6, alpha=0.85)
+    plt.xticks(x, labels)
+    plt.ylabel("CPU Time (s)")
+    plt.title("CPU Time")
+    plt.grid(True, axis="y", alpha=0.3)
+    for b, v in zip(bars2, times):
+        plt.text(b.get_x()+b.get_width()/2, v*1.01, f"{v:.2f}s", ha="center", va="bottom", fontsize=9)
+
+    plt.tight_layout()
+    plt.savefig(save_path, dpi=300, bbox_inches="tight")
+    plt.close()
+    print(f"Saved '{save_path}'")
+
+
+def plot_top_k(rows, save_path="plot_top_k.png"):
+    """Partial-sort comparisons vs k, with the full sort as a reference line."""
+    rows = _select(rows, "top_k")
+    plt.figure()
+    for (source, backend, n, S), (xs, ys) in _series(
+            _select(rows, "top_k", algorithm="hybrid_partial"),
+            ("source", "backend", "n", "S"), "k").items():
+        line, = plt.plot(xs, ys, marker='o', label=f"{_label(source, backend)} n={n:,} S={S}")
+        full = [r["comparisons"] for r in rows if r["algorithm"] == "hybrid"
+                and (r["source"], r["backend"], r["n"], r["S"]) == (source, backend, n, S)]
+        if full:
+            plt.axhline(full[-1], color=line.get_color(), linestyle="--", alpha=0.7)
+    plt.xscale("log")
+    plt.xlabel("k")
+    plt.ylabel("Key comparisons")
+    plt.title("Top-k partial sort comparisons vs k  (dashed: full sort)")
+    plt.legend()
+    plt.tight_layout()
+    plt.savefig(save_path)
+    plt.close()
+    print(f"Saved '{save_path}'")
+
+
+def render_all(rows):
+    """Build every plot that the loaded rows have data for."""
+    experiments = {r["experiment"] for r in rows}
+    algorithms = {r["algorithm"] for r in _select(rows, "compare")}
+    if "vary_n" in experiments:
+        plot_vary_n(rows)
+    if "vary_S" in experiments:
+        plot_vary_S(rows)
+    if experiments & {"vary_n", "vary_S"}:
+        plot_c_i_ii(rows)
+    if "optimal_S" in experiments:
+        plot_optimal_S(rows)
+    if algorithms & {"hybrid", "merge"}:
+        plot_compare(rows)
+    if algorithms & {"hybrid_buffered", "merge_buffered"}:
+        plot_compare(rows, ("hybrid_buffered", "merge_buffered"), "part_d_comparison_buffered.png")
+    if "top_k" in experiments:
+        plot_top_k(rows)
+
+
+# ── Main ──────────────────────────────────────────────────────────────────────
+
+if __name__ == "__main__":
+    # usage: python render.py [results files...]   (default: every results_*.csv/.jsonl here)
+    paths = sys.argv[1:] or sorted(glob.glob("results_*.csv") + glob.glob("results_*.jsonl"))
+    if not paths:
+        raise SystemExit("no results files given or found")
+    render_all(load_sources(paths))
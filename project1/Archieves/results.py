@@ -0,0 +1,76 @@
+import csv
+import json
+import os
+
+
+# ── Shared results format ────────────────────────────────────────────────────
+# One row per measured cell. Python experiments and cpp/main.cpp both write
+# these columns, so render.py can plot and overlay either.
+
+COLUMNS = ("experiment", "backend", "algorithm", "n", "S", "k", "comparisons", "time_s")
+INT_COLUMNS = ("n", "S", "k", "comparisons")
+
+
+class ResultsSink:
+    """Stream result rows to a .csv or .jsonl file, flushing after every row
+    so a long run can be rendered (or survives being killed) mid-way."""
+
+    def __init__(self, path, backend="python", mode="w"):
+        self.path = path
+        self.backend = backend
+        self.jsonl = path.endswith(".jsonl")
+        new_file = mode == "w" or not os.path.exists(path) or os.path.getsize(path) == 0
+        self._f = open(path, mode, newline="")
+        if not self.jsonl:
+            self._writer = csv.DictWriter(self._f, fieldnames=COLUMNS)
+            if new_file:
+                self._writer.writeheader()
+
+    def write(self, experiment, algorithm="hybrid", **fields):
+        row = {c: None for c in COLUMNS}
+        row.update(experiment=experiment, backend=self.backend, algorithm=algorithm)
+        unknown = fields.keys() - set(COLUMNS)
+        if unknown:
+            raise ValueError(f"unknown result columns: {sorted(unknown)}")
+        row.update(fields)
+        if self.jsonl:
+            self._f.write(json.dumps(row) + "\n")
+        else:
+            self._writer.writerow(row)
+        self._f.flush()
+
+    def close(self):
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _parse(row):
+    parsed = {}
+    for c in COLUMNS:
+        v = row.get(c)
+        if v is None or v == "":
+            parsed[c] = None
+        elif c in INT_COLUMNS:
+            parsed[c] = int(v)
+        elif c == "time_s":
+            parsed[c] = float(v)
+        else:
+            parsed[c] = v
+    return parsed
+
+
+def load_results(paths):
+    """Read rows from any mix of .csv and .jsonl result files."""
+    rows = []
+    for path in paths:
+        with open(path, newline="") as f:
+            if path.endswith(".jsonl"):
+                rows.extend(_parse(json.loads(line)) for line in f if line.strip())
+            else:
+                rows.extend(_parse(r) for r in csv.DictReader(f))
+    return rows
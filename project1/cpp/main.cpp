@@ -3,6 +3,7 @@
 #include <vector>
 #include <random>
 #include <chrono>
+#include <climits>
 #include "algorithms.h"
 
 // ── Data generation ───────────────────────────────────────────────────────────
@@ -15,9 +16,29 @@ std::vector<int> generate_array(int n, int x = 10'000'000) {
     return arr;
 }
 
+// ── Results sink ──────────────────────────────────────────────────────────────
+// Same columns as project1/Archieves/results.py so render.py can overlay
+// C++ and Python runs. Each row is flushed as soon as its cell finishes.
+
+void write_row(std::ofstream& out, const char* experiment, const char* algorithm,
+               int n, int S, long long comps, double seconds) {
+    out << experiment << ",cpp," << algorithm << "," << n << ",";
+    if (S > 0) out << S;
+    out << ",," << comps << "," << seconds << std::endl;
+}
+
+template <typename F>
+long long timed(F&& sort, double& seconds) {
+    auto t0 = std::chrono::high_resolution_clock::now();
+    long long comps = sort();
+    auto t1 = std::chrono::high_resolution_clock::now();
+    seconds = std::chrono::duration<double>(t1 - t0).count();
+    return comps;
+}
+
 // ── Experiment (c-i): fixed S, vary n ────────────────────────────────────────
 
-void experiment_vary_n(int S) {
+void experiment_vary_n(int S, std::ofstream& results) {
     std::vector<int> sizes = {1'000, 2'000, 5'000, 10'000, 20'000, 50'000,
                                100'000, 200'000, 500'000, 1'000'000,
                                2'000'000, 5'000'000, 10'000'000};
@@ -28,15 +49,17 @@ void experiment_vary_n(int S) {
     std::cout << "\n=== (c-i) Fixed S=" << S << ", vary n ===\n";
     for (int n : sizes) {
         auto arr = generate_array(n);
-        long long comps = hybrid_sort(arr, 0, n - 1, S);
+        double seconds;
+        long long comps = timed([&] { return hybrid_sort(arr, 0, n - 1, S); }, seconds);
         std::cout << "  n=" << n << "  comparisons=" << comps << "\n";
         csv << n << "," << comps << "\n";
+        write_row(results, "vary_n", "hybrid", n, S, comps, seconds);
     }
 }
 
 // ── Experiment (c-ii): fixed n, vary S ───────────────────────────────────────
 
-void experiment_vary_S(int n) {
+void experiment_vary_S(int n, std::ofstream& results) {
     auto arr_original = generate_array(n);
 
     std::ofstream csv("results_vary_S.csv");
@@ -45,15 +68,17 @@ void experiment_vary_S(int n) {
     std::cout << "\n=== (c-ii) Fixed n=" << n << ", vary S ===\n";
     for (int S = 1; S <= 100; S++) {
         auto arr = arr_original;
-        long long comps = hybrid_sort(arr, 0, n - 1, S);
+        double seconds;
+        long long comps = timed([&] { return hybrid_sort(arr, 0, n - 1, S); }, seconds);
         std::cout << "  S=" << S << "  comparisons=" << comps << "\n";
         csv << S << "," << comps << "\n";
+        write_row(results, "vary_S", "hybrid", n, S, comps, seconds);
     }
 }
 
 // ── Experiment (c-iii): find optimal S ───────────────────────────────────────
 
-void experiment_optimal_S() {
+void experiment_optimal_S(std::ofstream& results) {
     std::vector<int> sizes = {1'000, 5'000, 10'000, 50'000, 100'000};
 
     std::ofstream csv("results_optimal_S.csv");
@@ -66,7 +91,9 @@ void experiment_optimal_S() {
         long long best_comps = LLONG_MAX;
         for (int S = 1; S <= 100; S++) {
             auto arr = arr_original;
-            long long comps = hybrid_sort(arr, 0, n - 1, S);
+            double seconds;
+            long long comps = timed([&] { return hybrid_sort(arr, 0, n - 1, S); }, seconds);
+            write_row(results, "optimal_S", "hybrid", n, S, comps, seconds);
             if (comps < best_comps) {
                 best_comps = comps;
                 best_S = S;
@@ -80,21 +107,19 @@ void experiment_optimal_S() {
 
 // ── Experiment (d): hybrid vs merge_sort on 10M ──────────────────────────────
 
-void experiment_compare(int S, int n = 10'000'000) {
+void experiment_compare(int S, std::ofstream& results, int n = 10'000'000) {
     auto arr = generate_array(n);
 
     auto arr1 = arr;
-    auto t0 = std::chrono::high_resolution_clock::now();
-    long long comps_hybrid = hybrid_sort(arr1, 0, n - 1, S);
-    auto t1 = std::chrono::high_resolution_clock::now();
+    double time_hybrid;
+    long long comps_hybrid = timed([&] { return hybrid_sort(arr1, 0, n - 1, S); }, time_hybrid);
 
     auto arr2 = arr;
-    auto t2 = std::chrono::high_resolution_clock::now();
-    long long comps_merge = merge_sort(arr2, 0, n - 1);
-    auto t3 = std::chrono::high_resolution_clock::now();
+    double time_merge;
+    long long comps_merge = timed([&] { return merge_sort(arr2, 0, n - 1); }, time_merge);
 
-    double time_hybrid = std::chrono::duration<double>(t1 - t0).count();
-    double time_merge  = std::chrono::duration<double>(t3 - t2).count();
+    write_row(results, "compare", "hybrid", n, S, comps_hybrid, time_hybrid);
+    write_row(results, "compare", "merge", n, 0, comps_merge, time_merge);
 
     std::cout << "\n=== (d) Hybrid vs Mergesort on n=" << n << ", S=" << S << " ===\n";
     std::cout << "  hybrid_sort : " << comps_hybrid << " comparisons | " << time_hybrid << "s\n";
@@ -107,10 +132,13 @@ int main() {
     const int S_FIXED = 32;
     const int N_FIXED = 100'000;
 
-    experiment_vary_n(S_FIXED);
-    experiment_vary_S(N_FIXED);
-    experiment_optimal_S();
-    experiment_compare(S_FIXED);
+    std::ofstream results("results_cpp.csv");
+    results << "experiment,backend,algorithm,n,S,k,comparisons,time_s\n";
+
+    experiment_vary_n(S_FIXED, results);
+    experiment_vary_S(N_FIXED, results);
+    experiment_optimal_S(results);
+    experiment_compare(S_FIXED, results);
 
     return 0;
 }